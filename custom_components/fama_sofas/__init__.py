@@ -2,22 +2,38 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 import logging
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_ADDRESS, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import CONF_ADDRESS, CONF_NAME, Platform
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.entity import DeviceInfo
 
 from .ble_client import FamaSofaClient
-from .const import DOMAIN, GRADUAL_COMMANDS, MAX_CONTINUOUS_DURATION_SEC
+from .const import (
+    CONF_CHAR_HANDLES,
+    DOMAIN,
+    GRADUAL_COMMANDS,
+    MAX_CONTINUOUS_DURATION_SEC,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [Platform.BUTTON]
 
-type FamaSofasConfigEntry = ConfigEntry[FamaSofaClient]
+
+@dataclass
+class FamaSofasData:
+    """Runtime data for a Fama Sofas config entry."""
+
+    client: FamaSofaClient
+    device_info: DeviceInfo
+
+
+type FamaSofasConfigEntry = ConfigEntry[FamaSofasData]
 
 SERVICE_START = "start"
 SERVICE_STOP = "stop"
@@ -40,14 +56,7 @@ def _get_client_for_device(
     hass: HomeAssistant, device_id: str
 ) -> FamaSofaClient | None:
     """Find the FamaSofaClient for a given device ID."""
-    dev_reg = dr.async_get(hass)
-    device = dev_reg.async_get(device_id)
-    if not device:
-        return None
-    for entry_id in device.config_entries:
-        if entry_id in hass.data.get(DOMAIN, {}):
-            return hass.data[DOMAIN][entry_id]
-    return None
+    return hass.data.get(DOMAIN, {}).get(device_id)
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
@@ -87,9 +96,34 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 async def async_setup_entry(hass: HomeAssistant, entry: FamaSofasConfigEntry) -> bool:
     """Set up Fama Sofas from a config entry."""
     address: str = entry.data[CONF_ADDRESS]
-    client = FamaSofaClient(hass, address)
-    entry.runtime_data = client
-    hass.data[DOMAIN][entry.entry_id] = client
+
+    @callback
+    def _async_save_char_handles(handles: list[int]) -> None:
+        """Persist resolved characteristic handles to skip discovery later."""
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_CHAR_HANDLES: handles}
+        )
+
+    client = FamaSofaClient(
+        hass,
+        address,
+        char_handles=entry.data.get(CONF_CHAR_HANDLES),
+        on_char_handles=_async_save_char_handles,
+    )
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, address)},
+        name=entry.data.get(CONF_NAME, address),
+        manufacturer="Fama",
+        model="Paradis",
+    )
+    entry.runtime_data = FamaSofasData(client=client, device_info=device_info)
+
+    # Register the device up front so the service handlers can resolve
+    # device_id -> client with a single dict lookup.
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=entry.entry_id, **device_info
+    )
+    hass.data[DOMAIN][device.id] = client
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -97,8 +131,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: FamaSofasConfigEntry) ->
 
 async def async_unload_entry(hass: HomeAssistant, entry: FamaSofasConfigEntry) -> bool:
     """Unload a Fama Sofas config entry."""
-    client: FamaSofaClient = entry.runtime_data
+    client = entry.runtime_data.client
     await client.disconnect()
-    hass.data[DOMAIN].pop(entry.entry_id, None)
+    device = dr.async_get(hass).async_get_device(
+        identifiers={(DOMAIN, entry.data[CONF_ADDRESS])}
+    )
+    if device:
+        hass.data[DOMAIN].pop(device.id, None)
 
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
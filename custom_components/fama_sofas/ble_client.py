@@ -3,7 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import cached_property
 import logging
+import random
+import re
+from time import monotonic_ns
 
 from bleak import BleakClient
 from bleak.backends.characteristic import BleakGATTCharacteristic
@@ -12,63 +19,166 @@ from homeassistant.components.bluetooth import async_ble_device_from_address
 from homeassistant.core import HomeAssistant
 
 from .const import (
+    BATCH_WINDOW_SEC,
+    BOTH_MOTOR_COMMANDS,
     CHARACTERISTIC_UUID,
     COMMAND_BYTE_INDEX,
     COMMAND_FRAME,
     COMMAND_INTERVAL_SEC,
+    COMMAND_NAMES,
     CMD_STOP,
+    CONNECT_BACKOFF_MAX_SEC,
+    CONNECT_TIMEOUT,
+    MAX_CONNECT_RETRIES,
+    MAX_IN_FLIGHT_WRITES,
     MOTOR1_COMMANDS,
     MOTOR2_COMMANDS,
     SERVICE_UUID,
+    STOP_TIMEOUT,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-CONNECT_TIMEOUT = 15.0
-MAX_CONNECT_RETRIES = 3
 
-
-def _build_command(cmd: int) -> bytearray:
+def _build_command(cmd: int) -> bytes:
     """Build an 8-byte command frame with the given command byte."""
-    frame = bytearray(COMMAND_FRAME)
-    frame[COMMAND_BYTE_INDEX] = cmd
-    return frame
+    return (
+        COMMAND_FRAME[:COMMAND_BYTE_INDEX]
+        + bytes((cmd,))
+        + COMMAND_FRAME[COMMAND_BYTE_INDEX + 1 :]
+    )
+
+
+# Bleak backends do not expose the ATT error code uniformly, so an
+# "Invalid Handle" (0x01) failure is recognised by its message: BlueZ and
+# WinRT report "ATT error: 0x01 (Invalid Handle)"-style text, CoreBluetooth
+# "The handle is invalid."
+_INVALID_HANDLE_RE = re.compile(
+    r"invalid handle|handle is invalid|att error: 0x01\b", re.IGNORECASE
+)
 
+_COMMAND_INTERVAL_NS = int(COMMAND_INTERVAL_SEC * 1e9)
 
-def _command_channel(cmd: int) -> str:
-    """Return the channel name for a motor command."""
-    if cmd in MOTOR1_COMMANDS:
-        return "motor1"
-    if cmd in MOTOR2_COMMANDS:
-        return "motor2"
-    return "both"
+# Immutable per-command frames, built once so the send path never allocates.
+_FRAMES: dict[int, bytes] = {
+    cmd: _build_command(cmd)
+    for cmd in MOTOR1_COMMANDS | MOTOR2_COMMANDS | BOTH_MOTOR_COMMANDS | {CMD_STOP}
+}
 
 
-def _conflicting_channels(cmd: int) -> set[str]:
-    """Return the set of channels that must be cancelled before starting *cmd*.
+class Channel(IntEnum):
+    """Independent command channels; values index the per-channel slots."""
 
-    - An individual motor command conflicts with its own channel and "both".
-    - A both-motors command conflicts with all channels.
-    """
-    if cmd in MOTOR1_COMMANDS:
-        return {"motor1", "both"}
-    if cmd in MOTOR2_COMMANDS:
-        return {"motor2", "both"}
+    MOTOR1 = 0
+    MOTOR2 = 1
+    BOTH = 2
+
+
+# Channel and conflict tables, resolved once per command byte.
+#
+# - An individual motor command conflicts with its own channel and BOTH.
+# - A both-motors command conflicts with all channels.
+_ALL_CHANNELS: tuple[Channel, ...] = tuple(Channel)
+_CHANNEL_OF: dict[int, Channel] = {
+    **dict.fromkeys(MOTOR1_COMMANDS, Channel.MOTOR1),
+    **dict.fromkeys(MOTOR2_COMMANDS, Channel.MOTOR2),
+}
+_CONFLICTS_OF: dict[int, tuple[Channel, ...]] = {
+    **dict.fromkeys(MOTOR1_COMMANDS, (Channel.MOTOR1, Channel.BOTH)),
+    **dict.fromkeys(MOTOR2_COMMANDS, (Channel.MOTOR2, Channel.BOTH)),
+}
+
+
+def _is_invalid_handle_error(err: BaseException) -> bool:
+    """Return True if *err* reports an ATT Invalid Handle failure."""
+    return isinstance(err, BleakError) and bool(_INVALID_HANDLE_RE.search(str(err)))
+
+
+def _command_channel(cmd: int) -> Channel:
+    """Return the channel for a motor command."""
+    return _CHANNEL_OF.get(cmd, Channel.BOTH)
+
+
+def _conflicting_channels(cmd: int) -> tuple[Channel, ...]:
+    """Return the channels that must be cancelled before starting *cmd*."""
     # CMD_BOTH_OPEN / CMD_BOTH_CLOSE → cancel everything
-    return {"motor1", "motor2", "both"}
+    return _CONFLICTS_OF.get(cmd, _ALL_CHANNELS)
+
+
+@dataclass(slots=True)
+class _Request:
+    """A queued send_command() or stop() call (cmd is CMD_STOP for stop)."""
+
+    cmd: int
+    duration: float
+    future: asyncio.Future[None]
+
+
+def _coalesce(batch: list[_Request]) -> tuple[list[_Request], list[_Request]]:
+    """Reduce a batch to the requests that determine the final state.
+
+    Returns ``(effective, superseded)``.  A stop supersedes everything
+    queued before it; a motor command supersedes earlier commands on the
+    channels it would cancel anyway.
+    """
+    effective: list[_Request] = []
+    superseded: list[_Request] = []
+    for req in batch:
+        if req.cmd == CMD_STOP:
+            superseded.extend(effective)
+            effective = [req]
+            continue
+        conflicts = _conflicting_channels(req.cmd)
+        kept: list[_Request] = []
+        for prev in effective:
+            if prev.cmd != CMD_STOP and _command_channel(prev.cmd) in conflicts:
+                superseded.append(prev)
+            else:
+                kept.append(prev)
+        kept.append(req)
+        effective = kept
+    return effective, superseded
 
 
 class FamaSofaClient:
     """BLE client that manages connection and command sending for a Fama sofa."""
 
-    def __init__(self, hass: HomeAssistant, address: str) -> None:
-        """Initialize the client."""
+    # The firmware halts the motor on its own once refreshes stop, so an
+    # explicit STOP after a loop that ran its full duration is redundant.
+    SEND_TERMINAL_STOP: bool = False
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        address: str,
+        char_handles: list[int] | None = None,
+        on_char_handles: Callable[[list[int]], None] | None = None,
+    ) -> None:
+        """Initialize the client.
+
+        *char_handles* seeds the handle cache from a previous session and
+        *on_char_handles* is called whenever a fresh walk resolves them.
+        """
         self._hass = hass
         self._address = address
         self._client: BleakClient | None = None
-        self._target_chars: list[BleakGATTCharacteristic] = []
-        self._command_tasks: dict[str, asyncio.Task] = {}
-        self._lock = asyncio.Lock()
+        # Tracked locally (updated by the disconnected callback) because
+        # BleakClient.is_connected may query the OS on every access.
+        self._connected = False
+        # Cached so the per-write debug log costs a single attribute check;
+        # refreshed on every (re)connect to pick up log level changes.
+        self._debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        # Handles of the FFE1 characteristics found on a previous connection;
+        # the sofa's GATT layout is fixed, so reconnects look them up directly.
+        self._char_handles: list[int] = list(char_handles or ())
+        self._on_char_handles = on_char_handles
+        # Per-channel state, indexed by Channel.
+        self._command_tasks: list[asyncio.Task | None] = [None] * len(Channel)
+        self._command_cmds: list[int | None] = [None] * len(Channel)
+        self._deadlines: list[int] = [0] * len(Channel)  # monotonic ns
+        self._connect_lock = asyncio.Lock()
+        self._pending: asyncio.Queue[_Request] = asyncio.Queue()
+        self._batch_task: asyncio.Task | None = None
 
     @property
     def address(self) -> str:
@@ -79,19 +189,29 @@ class FamaSofaClient:
     def is_running(self) -> bool:
         """Return True if any command loop is currently running."""
         return any(
-            not task.done() for task in self._command_tasks.values()
+            task is not None and not task.done() for task in self._command_tasks
         )
 
     async def _ensure_connected(self) -> BleakClient:
         """Ensure we have an active BLE connection with retry logic."""
-        if self._client and self._client.is_connected:
+        if self._client is not None and self._connected:
             return self._client
 
-        # Clean up any stale client
-        self._client = None
-        self._target_chars = []
+        # Several channel loops may notice the dropped link at once; only
+        # one of them should drive the (re)connect.
+        async with self._connect_lock:
+            if self._client is not None and self._connected:
+                return self._client
+            return await self._connect()
+
+    async def _connect(self) -> BleakClient:
+        """Connect to the sofa, reusing the previous BleakClient if possible."""
+        self._connected = False
+        self._debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        self._invalidate_gatt()
 
         last_error: Exception | None = None
+        backoff_left = CONNECT_BACKOFF_MAX_SEC
         for attempt in range(1, MAX_CONNECT_RETRIES + 1):
             try:
                 _LOGGER.debug(
@@ -101,27 +221,37 @@ class FamaSofaClient:
                     self._address,
                 )
 
-                ble_device = async_ble_device_from_address(
-                    self._hass, self._address, connectable=True
-                )
-                if not ble_device:
-                    raise BleakError(
-                        f"Device {self._address} not found by HA Bluetooth scanner"
+                # Reconnecting the existing client lets backends reuse their
+                # attribute cache.  A failure counts as this attempt (so an
+                # attempt never exceeds one CONNECT_TIMEOUT); the next one
+                # builds a fresh client.
+                client = self._client
+                if client is not None:
+                    try:
+                        await client.connect()
+                    except (BleakError, TimeoutError, OSError):
+                        # Dropping the reference also mutes the stale
+                        # client's disconnected callback.
+                        self._client = None
+                        raise
+                else:
+                    ble_device = async_ble_device_from_address(
+                        self._hass, self._address, connectable=True
                     )
+                    if not ble_device:
+                        raise BleakError(
+                            f"Device {self._address} not found by HA Bluetooth scanner"
+                        )
 
-                client = BleakClient(
-                    ble_device,
-                    timeout=CONNECT_TIMEOUT,
-                    disconnected_callback=self._on_disconnect,
-                )
-                await client.connect()
-                self._client = client
-
-                # Resolve all FFE1 characteristics on FFE0 services.
-                # The device advertises duplicate FFE0 services — each may
-                # control a different motor, so we write to all of them.
-                self._target_chars = self._find_all_characteristics(client)
+                    client = BleakClient(
+                        ble_device,
+                        timeout=CONNECT_TIMEOUT,
+                        disconnected_callback=self._on_disconnect,
+                    )
+                    await client.connect()
+                    self._client = client
 
+                self._connected = True
                 _LOGGER.info(
                     "Connected to %s (char handles=%s)",
                     self._address,
@@ -137,13 +267,61 @@ class FamaSofaClient:
                     self._address,
                     err,
                 )
-                if attempt < MAX_CONNECT_RETRIES:
-                    await asyncio.sleep(1.0 * attempt)
+                if attempt < MAX_CONNECT_RETRIES and backoff_left > 0:
+                    # Jittered exponential backoff, so retries do not keep
+                    # lining up with the same source of 2.4 GHz interference.
+                    delay = min(
+                        random.uniform(0.5, 1.5) * (1 << (attempt - 1)),
+                        backoff_left,
+                    )
+                    backoff_left -= delay
+                    await asyncio.sleep(delay)
 
         raise BleakError(
             f"Failed to connect to {self._address} after {MAX_CONNECT_RETRIES} attempts: {last_error}"
         )
 
+    @cached_property
+    def _target_chars(self) -> list[BleakGATTCharacteristic]:
+        """Return the FFE1 characteristics to write to on this connection.
+
+        The device advertises duplicate FFE0 services — each may control a
+        different motor, so we write to all of them.
+        """
+        if self._client is None:
+            return []
+        if self._char_handles:
+            services = self._client.services
+            chars = [services.get_characteristic(h) for h in self._char_handles]
+            if all(
+                char is not None and char.uuid == CHARACTERISTIC_UUID
+                for char in chars
+            ):
+                return chars
+            _LOGGER.debug(
+                "Cached characteristic handles %s are stale for %s",
+                self._char_handles,
+                self._address,
+            )
+        chars = self._find_all_characteristics(self._client)
+        self._char_handles = [char.handle for char in chars]
+        if chars and self._on_char_handles is not None:
+            self._on_char_handles(self._char_handles)
+        return chars
+
+    @cached_property
+    def _write_plan(self) -> list[tuple[BleakGATTCharacteristic, bool]]:
+        """Pair each target characteristic with its write-without-response support."""
+        return [
+            (char, "write-without-response" in char.properties)
+            for char in self._target_chars
+        ]
+
+    def _invalidate_gatt(self) -> None:
+        """Drop the connection-scoped characteristic lookups."""
+        self.__dict__.pop("_target_chars", None)
+        self.__dict__.pop("_write_plan", None)
+
     def _find_all_characteristics(
         self, client: BleakClient
     ) -> list[BleakGATTCharacteristic]:
@@ -178,41 +356,117 @@ class FamaSofaClient:
 
     def _on_disconnect(self, client: BleakClient) -> None:
         """Handle BLE disconnection."""
+        if client is not self._client:
+            # A replaced client must not clobber the current connection.
+            _LOGGER.debug("Ignoring disconnect of stale client for %s", self._address)
+            return
         _LOGGER.warning("Disconnected from %s", self._address)
-        self._client = None
-        self._target_chars = []
+        # Keep the BleakClient for a cheaper reconnect; only the resolved
+        # characteristics may be stale.
+        self._connected = False
+        self._invalidate_gatt()
 
     async def _send_single_command(self, cmd: int) -> None:
-        """Send a single command frame to all matching characteristics."""
+        """Send a single command frame to all matching characteristics.
+
+        Refresh frames use write-without-response on every characteristic
+        that supports it: a lost frame is simply superseded by the next one.
+        STOP is always acknowledged.
+        """
         client = await self._ensure_connected()
-        frame = _build_command(cmd)
+        frame = _FRAMES[cmd]
+        is_stop = cmd == CMD_STOP
 
         if self._target_chars:
-            for char in self._target_chars:
-                await client.write_gatt_char(char, frame, response=True)
+            # Overlap the per-characteristic round-trips; a failure on one
+            # module must not keep the frame from reaching the others.
+            results = await asyncio.gather(
+                *(
+                    client.write_gatt_char(
+                        char, frame, response=is_stop or not unacked
+                    )
+                    for char, unacked in self._write_plan
+                ),
+                return_exceptions=True,
+            )
+            errors = [res for res in results if isinstance(res, BaseException)]
+            if errors:
+                if self._char_handles and any(
+                    _is_invalid_handle_error(err) for err in errors
+                ):
+                    # The cached handles no longer match the device's GATT
+                    # table; re-resolve the characteristics on the next send.
+                    self._char_handles = []
+                    self._invalidate_gatt()
+                raise errors[0]
         else:
             # Fallback to UUID-based write
             await client.write_gatt_char(CHARACTERISTIC_UUID, frame, response=True)
 
-        _LOGGER.debug("Sent command 0x%02X to %s", cmd, self._address)
+        if self._debug:
+            _LOGGER.debug("Sent command 0x%02X to %s", cmd, self._address)
+
+    async def _command_loop(
+        self, cmd: int, duration: float, channel: Channel
+    ) -> None:
+        """Send a command repeatedly for the given duration (dead man's switch).
 
-    async def _command_loop(self, cmd: int, duration: float, channel: str) -> None:
-        """Send a command repeatedly for the given duration (dead man's switch)."""
+        The loop runs until ``self._deadlines[channel]``, which
+        :meth:`send_command` may push back while the loop is running.
+
+        Refresh writes are dispatched on a fixed schedule without waiting
+        for the previous one to finish, with at most MAX_IN_FLIGHT_WRITES
+        outstanding; a tick is skipped while that window is full.
+        """
         _LOGGER.info(
-            "Starting command loop: cmd=0x%02X duration=%ss channel=%s for %s",
+            "Starting command loop: cmd=%s (0x%02X) duration=%ss channel=%s for %s",
+            COMMAND_NAMES.get(cmd, "unknown"),
             cmd,
             duration,
-            channel,
+            channel.name,
             self._address,
         )
         cancelled = False
+        failed = False
+        in_flight: set[asyncio.Task] = set()
         try:
-            end_time = asyncio.get_event_loop().time() + duration
+            deadlines = self._deadlines
+            interval = _COMMAND_INTERVAL_NS
+            send = self._send_single_command
+            sleep = asyncio.sleep
+            create_task = asyncio.create_task
+            next_send = monotonic_ns()
             count = 0
-            while asyncio.get_event_loop().time() < end_time:
-                await self._send_single_command(cmd)
-                count += 1
-                await asyncio.sleep(COMMAND_INTERVAL_SEC)
+            while monotonic_ns() < deadlines[channel]:
+                if in_flight:
+                    done = {task for task in in_flight if task.done()}
+                    in_flight -= done
+                    # Retrieve every result so no failure goes unobserved,
+                    # then surface the first write error.
+                    errors = [
+                        err
+                        for task in done
+                        if not task.cancelled()
+                        and (err := task.exception()) is not None
+                    ]
+                    if errors:
+                        raise errors[0]
+                if not count:
+                    # The first write runs inline: it also (re)establishes
+                    # the connection the pipelined writes rely on.
+                    await send(cmd)
+                    count += 1
+                elif len(in_flight) < MAX_IN_FLIGHT_WRITES:
+                    in_flight.add(create_task(send(cmd)))
+                    count += 1
+                # Pace against a fixed schedule so write latency does not
+                # stretch the refresh period.  If we fell more than a full
+                # interval behind, restart the schedule instead of bursting.
+                next_send += interval
+                now = monotonic_ns()
+                if now - next_send > interval:
+                    next_send = now
+                await sleep(max(0, next_send - now) / 1e9)
             _LOGGER.info(
                 "Command loop finished naturally after %d sends for %s",
                 count,
@@ -222,6 +476,7 @@ class FamaSofaClient:
             cancelled = True
             _LOGGER.debug("Command loop cancelled for %s", self._address)
         except Exception as err:
+            failed = True
             _LOGGER.error(
                 "Error during command loop for %s: %s (%s)",
                 self._address,
@@ -229,21 +484,37 @@ class FamaSofaClient:
                 type(err).__name__,
             )
         finally:
-            # Remove ourselves from the task dict
-            self._command_tasks.pop(channel, None)
-
-            # Send a STOP only when the loop ended on its own (natural
-            # completion or error) and no other motors are still running.
+            # Release our channel slot (unless it was already handed over)
+            # before any await, so a press arriving while we unwind starts
+            # a new loop instead of extending this one.
+            if self._command_tasks[channel] is asyncio.current_task():
+                self._command_tasks[channel] = None
+                self._command_cmds[channel] = None
+
+            # Abandon refresh writes still in flight; they are superseded
+            # either by the STOP below or by whatever replaces this loop.
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+            # Send a STOP only when the loop ended on its own and no other
+            # motors are still running.  After an error the STOP is always
+            # attempted; after natural completion only if SEND_TERMINAL_STOP
+            # is set, since the firmware already stops without refreshes.
             # When the loop was *cancelled* the caller takes care of what
             # comes next (either an explicit stop() or a replacement command),
             # so we must not inject a STOP that would kill other motors.
-            if not cancelled:
-                has_others = any(
-                    not t.done() for t in self._command_tasks.values()
-                )
-                if not has_others:
+            if not cancelled and (failed or self.SEND_TERMINAL_STOP):
+                if not self.is_running:
                     try:
-                        await self._send_single_command(CMD_STOP)
+                        # Shield the write so a late cancellation (e.g. HA
+                        # shutting down) cannot abort it mid-flight.
+                        await asyncio.shield(
+                            asyncio.wait_for(
+                                self._send_single_command(CMD_STOP),
+                                timeout=STOP_TIMEOUT,
+                            )
+                        )
                         _LOGGER.debug(
                             "Stop command sent after loop for %s", self._address
                         )
@@ -258,52 +529,153 @@ class FamaSofaClient:
         """Start sending a command for the specified duration.
 
         Only cancels command tasks on conflicting channels, allowing
-        independent motors to run concurrently.
+        independent motors to run concurrently.  Re-sending the command
+        that is already running on its channel just extends its deadline.
         """
-        async with self._lock:
-            channel = _command_channel(cmd)
-            for ch in _conflicting_channels(cmd):
-                await self._cancel_channel(ch)
-            self._command_tasks[channel] = asyncio.create_task(
-                self._command_loop(cmd, duration, channel)
-            )
+        await self._submit(cmd, duration)
 
     async def stop(self) -> None:
         """Stop any running command and send the stop command."""
-        async with self._lock:
-            await self._cancel_all_channels()
+        await self._submit(CMD_STOP, 0.0)
+
+    async def _submit(self, cmd: int, duration: float) -> None:
+        """Queue a request for the batcher and wait until it is applied."""
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_task = asyncio.create_task(self._run_batches())
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._pending.put_nowait(_Request(cmd, duration, future))
+        await future
+
+    async def _run_batches(self) -> None:
+        """Collect queued requests and apply only their net effect.
+
+        Requests arriving within BATCH_WINDOW_SEC of the first one are
+        handled together, so a burst of presses costs one teardown and
+        one loop start per channel instead of one per press.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._pending.get()]
+            window_end = loop.time() + BATCH_WINDOW_SEC
             try:
-                await self._send_single_command(CMD_STOP)
-                _LOGGER.info("Stop command sent to %s", self._address)
-            except Exception as err:
-                _LOGGER.error(
-                    "Failed to send stop to %s: %s (%s)",
-                    self._address,
-                    err,
-                    type(err).__name__,
-                )
+                while (remaining := window_end - loop.time()) > 0:
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(self._pending.get(), remaining)
+                        )
+                    except TimeoutError:
+                        break
+                effective, superseded = _coalesce(batch)
+                for req in superseded:
+                    if not req.future.done():
+                        req.future.set_result(None)
+                for req in effective:
+                    try:
+                        if req.cmd == CMD_STOP:
+                            await self._apply_stop()
+                        else:
+                            await self._apply_command(req.cmd, req.duration)
+                    except Exception as err:
+                        if not req.future.done():
+                            req.future.set_exception(err)
+                    else:
+                        if not req.future.done():
+                            req.future.set_result(None)
+            finally:
+                # Never leave a caller waiting on a request we dropped.
+                for req in batch:
+                    if not req.future.done():
+                        req.future.cancel()
+
+    async def _apply_command(self, cmd: int, duration: float) -> None:
+        """Start (or extend) the command loop for *cmd*.
+
+        Only ever called from the batch task, which applies requests one
+        at a time, so no lock is needed around the channel state.
+        """
+        channel = _command_channel(cmd)
+        deadline = monotonic_ns() + int(duration * 1e9)
+        task = self._command_tasks[channel]
+        if task and not task.done() and self._command_cmds[channel] == cmd:
+            self._deadlines[channel] = deadline
+            _LOGGER.debug(
+                "Extended command 0x%02X on channel %s for %s",
+                cmd,
+                channel.name,
+                self._address,
+            )
+            return
+        for ch in _conflicting_channels(cmd):
+            await self._cancel_channel(ch)
+        self._command_cmds[channel] = cmd
+        self._deadlines[channel] = deadline
+        self._command_tasks[channel] = asyncio.create_task(
+            self._command_loop(cmd, duration, channel)
+        )
+
+    async def _apply_stop(self) -> None:
+        """Cancel all command loops and send the stop command."""
+        await self._cancel_all_channels()
+        try:
+            await self._send_single_command(CMD_STOP)
+            _LOGGER.info("Stop command sent to %s", self._address)
+        except Exception as err:
+            _LOGGER.error(
+                "Failed to send stop to %s: %s (%s)",
+                self._address,
+                err,
+                type(err).__name__,
+            )
 
-    async def _cancel_channel(self, channel: str) -> None:
+    async def _cancel_channel(self, channel: Channel) -> None:
         """Cancel the command task for the given channel if running."""
-        task = self._command_tasks.get(channel)
+        task = self._command_tasks[channel]
         if task and not task.done():
             task.cancel()
             try:
                 await task
             except asyncio.CancelledError:
-                pass
-        self._command_tasks.pop(channel, None)
+                # Only swallow the loop's own cancellation; if we are being
+                # cancelled too (e.g. disconnect() stopping the batcher),
+                # propagate so no replacement loop gets started.
+                if (current := asyncio.current_task()) and current.cancelling():
+                    raise
+        self._command_tasks[channel] = None
+        self._command_cmds[channel] = None
 
     async def _cancel_all_channels(self) -> None:
         """Cancel command tasks on all channels."""
-        for channel in list(self._command_tasks):
-            await self._cancel_channel(channel)
+        tasks = [
+            task for task in self._command_tasks if task and not task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        # Wait for all loops to unwind concurrently rather than one by one.
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for channel in Channel:
+            self._command_tasks[channel] = None
+            self._command_cmds[channel] = None
 
     async def disconnect(self) -> None:
-        """Disconnect from the BLE device."""
+        """Disconnect from the BLE device.
+
+        The batcher is stopped first so that it cannot start new command
+        loops while the channels are being torn down.
+        """
+        if self._batch_task and not self._batch_task.done():
+            self._batch_task.cancel()
+            try:
+                await self._batch_task
+            except asyncio.CancelledError:
+                if (current := asyncio.current_task()) and current.cancelling():
+                    raise
+        self._batch_task = None
+        while not self._pending.empty():
+            self._pending.get_nowait().future.cancel()
         await self._cancel_all_channels()
-        if self._client and self._client.is_connected:
+        if self._client and self._connected:
             await self._client.disconnect()
             _LOGGER.debug("Disconnected from %s", self._address)
         self._client = None
-        self._target_chars = []
+        self._connected = False
+        self._invalidate_gatt()
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 import logging
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
-from homeassistant.const import CONF_ADDRESS, CONF_NAME
+from homeassistant.const import CONF_ADDRESS
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -23,7 +23,6 @@ from .const import (
     CMD_STOP,
     CONF_DURATION,
     DEFAULT_DURATION_SEC,
-    DOMAIN,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -34,7 +33,6 @@ class FamaSofaButtonDescription(ButtonEntityDescription):
     """Describe a Fama Sofa button."""
 
     command: int
-    is_stop: bool = False
 
 
 BUTTON_DESCRIPTIONS: tuple[FamaSofaButtonDescription, ...] = (
@@ -72,7 +70,6 @@ BUTTON_DESCRIPTIONS: tuple[FamaSofaButtonDescription, ...] = (
         key="stop",
         translation_key="stop",
         command=CMD_STOP,
-        is_stop=True,
     ),
 )
 
@@ -83,16 +80,15 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Fama Sofa buttons from a config entry."""
-    client = entry.runtime_data
+    data = entry.runtime_data
     address = entry.data[CONF_ADDRESS]
-    name = entry.data.get(CONF_NAME, address)
     duration = entry.options.get(CONF_DURATION, DEFAULT_DURATION_SEC)
 
     async_add_entities(
         FamaSofaButton(
-            client=client,
+            client=data.client,
             address=address,
-            device_name=name,
+            device_info=data.device_info,
             description=desc,
             duration=duration,
         )
@@ -110,7 +106,7 @@ class FamaSofaButton(ButtonEntity):
         self,
         client: FamaSofaClient,
         address: str,
-        device_name: str,
+        device_info: DeviceInfo,
         description: FamaSofaButtonDescription,
         duration: int,
     ) -> None:
@@ -120,16 +116,11 @@ class FamaSofaButton(ButtonEntity):
         self.entity_description = description
 
         self._attr_unique_id = f"{address}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=device_name,
-            manufacturer="Fama",
-            model="Paradis",
-        )
+        self._attr_device_info = device_info
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        if self.entity_description.is_stop:
+        if self.entity_description.command == CMD_STOP:
             await self._client.stop()
         else:
             await self._client.send_command(
@@ -93,13 +93,13 @@ class FamaSofasConfigFlow(ConfigFlow, domain=DOMAIN):
             )
 
         current_addresses = self._async_current_ids()
-        for info in async_discovered_service_info(self.hass, connectable=True):
-            if (
-                info.address not in current_addresses
-                and info.name
-                and info.name.startswith("Sofa")
-            ):
-                self._discovered_devices[info.address] = info
+        self._discovered_devices = {
+            info.address: info
+            for info in async_discovered_service_info(self.hass, connectable=True)
+            if (name := info.name)
+            and name.startswith("Sofa")
+            and info.address not in current_addresses
+        }
 
         if not self._discovered_devices:
             return self.async_abort(reason="no_devices_found")
@@ -1,5 +1,7 @@
 """Constants for the Fama Sofas integration."""
 
+from types import MappingProxyType
+
 DOMAIN = "fama_sofas"
 
 # BLE UUIDs
@@ -7,7 +9,7 @@ SERVICE_UUID = "0000ffe0-0000-1000-8000-00805f9b34fb"
 CHARACTERISTIC_UUID = "0000ffe1-0000-1000-8000-00805f9b34fb"
 
 # Command frame: [0x00, 0x00, CMD, 0x01, 0x01, 0x01, 0x00, 0x00]
-COMMAND_FRAME = bytearray([0x00, 0x00, 0x00, 0x01, 0x01, 0x01, 0x00, 0x00])
+COMMAND_FRAME = bytes((0x00, 0x00, 0x00, 0x01, 0x01, 0x01, 0x00, 0x00))
 COMMAND_BYTE_INDEX = 2
 
 # Motor commands (byte 2)
@@ -23,9 +25,18 @@ CMD_STOP = 0x07
 COMMAND_INTERVAL_SEC = 0.2  # 200ms between repeated commands
 DEFAULT_DURATION_SEC = 120  # Default press duration in seconds
 MAX_CONTINUOUS_DURATION_SEC = 180  # Safety timeout for gradual control
+BATCH_WINDOW_SEC = 0.02  # Window for coalescing queued send/stop requests
+
+# Connection
+CONNECT_TIMEOUT = 15.0  # Per-attempt BLE connect timeout in seconds
+MAX_CONNECT_RETRIES = 3
+CONNECT_BACKOFF_MAX_SEC = 4.0  # Total sleep budget across connect retries
+STOP_TIMEOUT = 2.0  # Upper bound for the STOP sent after a loop ends
+MAX_IN_FLIGHT_WRITES = 3  # Unfinished refresh writes allowed per command loop
 
 # Config
 CONF_DURATION = "command_duration"
+CONF_CHAR_HANDLES = "gatt_char_handles"
 
 # Motor command groups (for channel resolution)
 MOTOR1_COMMANDS = frozenset({CMD_MOTOR1_OPEN, CMD_MOTOR1_CLOSE})
@@ -33,11 +44,18 @@ MOTOR2_COMMANDS = frozenset({CMD_MOTOR2_OPEN, CMD_MOTOR2_CLOSE})
 BOTH_MOTOR_COMMANDS = frozenset({CMD_BOTH_OPEN, CMD_BOTH_CLOSE})
 
 # Gradual control: command name -> command byte mapping
-GRADUAL_COMMANDS: dict[str, int] = {
-    "motor1_open": CMD_MOTOR1_OPEN,
-    "motor1_close": CMD_MOTOR1_CLOSE,
-    "motor2_open": CMD_MOTOR2_OPEN,
-    "motor2_close": CMD_MOTOR2_CLOSE,
-    "both_open": CMD_BOTH_OPEN,
-    "both_close": CMD_BOTH_CLOSE,
-}
+GRADUAL_COMMANDS: MappingProxyType[str, int] = MappingProxyType(
+    {
+        "motor1_open": CMD_MOTOR1_OPEN,
+        "motor1_close": CMD_MOTOR1_CLOSE,
+        "motor2_open": CMD_MOTOR2_OPEN,
+        "motor2_close": CMD_MOTOR2_CLOSE,
+        "both_open": CMD_BOTH_OPEN,
+        "both_close": CMD_BOTH_CLOSE,
+    }
+)
+
+# Reverse mapping: command byte -> command name
+COMMAND_NAMES: MappingProxyType[int, str] = MappingProxyType(
+    {cmd: name for name, cmd in GRADUAL_COMMANDS.items()}
+)
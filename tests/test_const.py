@@ -0,0 +1,74 @@
+"""Tests for the Fama Sofas command constants."""
+
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+import pytest
+
+# Load const.py on its own so the tests don't need Home Assistant installed.
+_CONST_PATH = (
+    Path(__file__).resolve().parents[1] / "custom_components" / "fama_sofas" / "const.py"
+)
+_spec = spec_from_file_location("fama_sofas_const", _CONST_PATH)
+const = module_from_spec(_spec)
+_spec.loader.exec_module(const)
+
+
+@pytest.mark.parametrize(
+    ("name", "byte"),
+    [
+        ("motor1_open", 0x04),
+        ("motor1_close", 0x03),
+        ("motor2_open", 0x01),
+        ("motor2_close", 0x02),
+        ("both_open", 0x05),
+        ("both_close", 0x06),
+    ],
+)
+def test_gradual_command_bytes(name, byte):
+    """Each gradual command name maps to its protocol byte."""
+    assert const.GRADUAL_COMMANDS[name] == byte
+    assert const.COMMAND_NAMES[byte] == name
+
+
+def test_gradual_commands_exclude_stop():
+    """Stop is sent once, never repeated as a gradual command."""
+    assert const.CMD_STOP == 0x07
+    assert const.CMD_STOP not in const.COMMAND_NAMES
+    assert len(const.GRADUAL_COMMANDS) == 6
+
+
+def test_command_names_is_inverse():
+    """COMMAND_NAMES is the exact inverse of GRADUAL_COMMANDS."""
+    assert dict(const.COMMAND_NAMES) == {
+        byte: name for name, byte in const.GRADUAL_COMMANDS.items()
+    }
+    assert len(const.COMMAND_NAMES) == len(const.GRADUAL_COMMANDS)
+
+
+@pytest.mark.parametrize("mapping", ["GRADUAL_COMMANDS", "COMMAND_NAMES"])
+def test_command_tables_are_read_only(mapping):
+    """The shared command tables can't be mutated at runtime."""
+    table = getattr(const, mapping)
+    key = next(iter(table))
+    with pytest.raises(TypeError):
+        table[key] = table[key]
+    with pytest.raises(TypeError):
+        del table[key]
+
+
+@pytest.mark.parametrize(
+    "cmd", [*const.GRADUAL_COMMANDS.values(), const.CMD_STOP]
+)
+def test_command_frame_layout(cmd):
+    """Every command produces the 8-byte frame with the byte at its index."""
+    index = const.COMMAND_BYTE_INDEX
+    frame = (
+        const.COMMAND_FRAME[:index]
+        + bytes((cmd,))
+        + const.COMMAND_FRAME[index + 1 :]
+    )
+
+    assert len(frame) == 8
+    assert frame[index] == cmd
+    assert frame == bytes((0x00, 0x00, cmd, 0x01, 0x01, 0x01, 0x00, 0x00))